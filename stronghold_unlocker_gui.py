@@ -2,10 +2,16 @@
 # stronghold_unlocker_gui.py
 # GUI unlocker for Stronghold Crusader DE maps.
 
+import functools
 import os
+import re
+import shutil
+import string
+import struct
 import sys
 import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from dataclasses import dataclass
 import tkinter as tk
@@ -20,6 +26,13 @@ try:
 except Exception:
     _HAS_PIL = False
 
+# Optional: orjson for faster JSON encode/decode
+try:
+    import orjson
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
+
 # ----------------------------
 # Constants / Links
 # ----------------------------
@@ -50,6 +63,31 @@ ICON_FILE = "images/app.ico"
 # ----------------------------
 # Resource helpers (work for script & PyInstaller EXE)
 # ----------------------------
+def _base_dirs() -> tuple:
+    """Resolve the resource base directories once, in search order:
+    1) MEIPASS  2) <exe_dir>  3) <script_dir>
+    """
+    dirs = []
+    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+        dirs.append(Path(sys._MEIPASS))
+    if getattr(sys, "frozen", False):
+        dirs.append(Path(sys.executable).parent)
+    dirs.append(Path(__file__).parent)
+    out, seen = [], set()
+    for d in dirs:
+        rp = d.resolve()
+        if rp not in seen:
+            seen.add(rp)
+            out.append(rp)
+    return tuple(out)
+
+# Frozen-ness and script location cannot change at runtime, so resolve
+# the candidate roots once at import instead of on every lookup
+# (Path.resolve costs filesystem syscalls, especially on Windows).
+_BASE_DIRS = _base_dirs()
+_LANG_DIRS = tuple(d / "lang" for d in _BASE_DIRS)
+
+@functools.lru_cache(maxsize=64)
 def resource_path(rel: str) -> Path:
     """
     Find a resource file both when running from source and when frozen by PyInstaller.
@@ -58,39 +96,24 @@ def resource_path(rel: str) -> Path:
     2) <exe_dir>/<rel>
     3) <script_dir>/<rel>
     """
-    rel_path = Path(rel)
-    base_candidates = []
-    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-        base_candidates.append(Path(sys._MEIPASS))
-    if getattr(sys, "frozen", False):
-        base_candidates.append(Path(sys.executable).parent)
-    base_candidates.append(Path(__file__).parent)
-
-    for base in base_candidates:
-        p = (base / rel_path).resolve()
+    for base in _BASE_DIRS:
+        p = base / rel
         if p.exists():
             return p
-    return (base_candidates[-1] / rel_path).resolve()
+    return _BASE_DIRS[-1] / rel
 
 def language_dirs() -> list[Path]:
     """Return possible language directories to search (MEIPASS/lang, exe_dir/lang, script_dir/lang)."""
-    dirs = []
-    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-        dirs.append(Path(sys._MEIPASS) / "lang")
-    if getattr(sys, "frozen", False):
-        dirs.append(Path(sys.executable).parent / "lang")
-    dirs.append(Path(__file__).parent / "lang")
-    out, seen = [], set()
-    for d in dirs:
-        rp = d.resolve()
-        if rp not in seen:
-            seen.add(rp)
-            out.append(rp)
-    return out
+    return list(_LANG_DIRS)
 
 def images_path(rel: str) -> Path:
     return resource_path(f"images/{rel}")
 
+# Decoded/scaled logo images keyed by (path, max_w, max_h). PhotoImage
+# objects must stay referenced to be displayed anyway, so keeping them
+# here means each asset is decoded at most once per process.
+_IMG_CACHE = {}
+
 # ----------------------------
 # Config helpers
 # ----------------------------
@@ -101,82 +124,157 @@ def config_dir() -> Path:
             return Path(base) / "bonsaibauer" / "stronghold_map_unlocker"
     return Path.home() / ".stronghold_map_unlocker"
 
+# In-memory config so repeat load_config() calls never re-read the file
+_config_cache = None
+
 def load_config() -> dict:
+    global _config_cache
+    if _config_cache is not None:
+        return _config_cache
     try:
         p = config_dir() / "config.json"
         if p.exists():
-            return json.loads(p.read_text(encoding="utf-8"))
+            raw = p.read_bytes()
+            _config_cache = orjson.loads(raw) if _HAS_ORJSON else json.loads(raw.decode("utf-8"))
+            return _config_cache
     except Exception:
         pass
-    return {}
+    _config_cache = {}
+    return _config_cache
 
 def save_config(cfg: dict):
+    global _config_cache
+    _config_cache = cfg
     try:
         d = config_dir()
         d.mkdir(parents=True, exist_ok=True)
         p = d / "config.json"
-        p.write_text(json.dumps(cfg, ensure_ascii=False, indent=2), encoding="utf-8")
+        # Write to a sibling temp file and rename over the target so a
+        # crash mid-write never leaves a torn config behind.
+        tmp = d / "config.json.tmp"
+        if _HAS_ORJSON:
+            tmp.write_bytes(orjson.dumps(cfg, option=orjson.OPT_INDENT_2))
+        else:
+            tmp.write_text(json.dumps(cfg, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, p)
     except Exception:
         pass
 
 # ----------------------------
 # Core unlocking logic
 # ----------------------------
+# Precompiled little-endian u16 for header offsets
+_U16LE = struct.Struct("<H")
+
+# Debug switch: read the patched byte back after writing. The write goes
+# through a cleanly flushed r+b handle, so the read-back is pure paranoia
+# and costs an extra seek+read per map.
+VERIFY_WRITES = False
+
 class MapUnlocker:
+    # How much of the file to pre-read for header parsing; the offsets we
+    # need almost always fall inside the first 4 KiB.
+    _HDR_SIZE = 4096
+
     @staticmethod
-    def read_u16_le_at(f, off: int) -> int:
+    def _read_u16_le(f, hdr: bytes, off: int) -> int:
+        """Read a u16 at off, from the pre-read header buffer if possible."""
+        if off + 2 <= len(hdr):
+            return _U16LE.unpack_from(hdr, off)[0]
         f.seek(off)
         b = f.read(2)
         if len(b) != 2:
             raise ValueError(f"Unexpected EOF at 0x{off:X}")
-        return int.from_bytes(b, "little")
-
-    @staticmethod
-    def compute_base(path: Path) -> int:
-        with open(path, "rb") as f:
-            A = MapUnlocker.read_u16_le_at(f, 0x04)
-            B = MapUnlocker.read_u16_le_at(f, A + 0x08)
-            return A + 0x3C + B
+        return _U16LE.unpack(b)[0]
 
     @staticmethod
-    def read_byte_at(path: Path, off: int) -> int:
-        with open(path, "rb") as f:
-            f.seek(off)
-            b = f.read(1)
-            if len(b) != 1:
-                raise ValueError(f"Unexpected EOF at 0x{off:X}")
-            return b[0]
-
-    @staticmethod
-    def write_byte_at(path: Path, off: int, value: int):
-        with open(path, "r+b") as f:
-            f.seek(off)
-            f.write(bytes([value & 0xFF]))
-
-    @staticmethod
-    def build_unlocked_name(src: Path, dest_dir: Path) -> Path:
+    def build_unlocked_name(src: Path, dest_dir: Path, claimed: set = None) -> Path:
+        """Pick a free "<stem> [unlocked]...map" path in dest_dir.
+
+        `claimed` lets a batch reserve names before any file exists on
+        disk: names already in the set count as taken, and the chosen
+        name is added to it. Callers unlocking several maps concurrently
+        must pre-reserve all names this way on one thread, otherwise two
+        maps with the same stem resolve to the same output path.
+        """
         dest_dir.mkdir(parents=True, exist_ok=True)
         stem = src.stem
         ext = src.suffix or ".map"
-        out = dest_dir / f"{stem} [unlocked]{ext}"
+        # Snapshot the directory once instead of stat()ing candidate after
+        # candidate -- with many existing "[unlocked]" siblings the old
+        # exists() loop was one syscall per probe.
+        with os.scandir(dest_dir) as it:
+            taken = {e.name.lower() for e in it}
+        if claimed:
+            taken |= claimed
+        name = f"{stem} [unlocked]{ext}"
         i = 2
-        while out.exists():
-            out = dest_dir / f"{stem} [unlocked] ({i}){ext}"
+        while name.lower() in taken:
+            name = f"{stem} [unlocked] ({i}){ext}"
             i += 1
-        return out
+        if claimed is not None:
+            claimed.add(name.lower())
+        return dest_dir / name
+
+    @staticmethod
+    def _fast_copy(src: Path, dst: Path):
+        """Copy src -> dst, using the kernel fast path on Windows.
+
+        CopyFileW copies entirely in kernel mode (and can reflink on
+        filesystems with block cloning) instead of pumping the file
+        through Python-level buffered reads and writes.
+        """
+        if os.name == "nt":
+            try:
+                import ctypes
+                if ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+                    return
+            except Exception:
+                pass
+        # Fallback: hint the kernel that the source is read once, front to
+        # back, so it widens read-ahead and drops pages after use, and copy
+        # with a large buffer instead of shutil's default chunk size.
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            if hasattr(os, "posix_fadvise"):
+                try:
+                    os.posix_fadvise(fsrc.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass
+            shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
 
     @staticmethod
-    def copy_and_unlock(src: Path, dest_dir: Path):
-        """Copy src to dest_dir with [unlocked].map suffix and patch BASE+0x08 = 0x00."""
-        import shutil
-        out = MapUnlocker.build_unlocked_name(src, dest_dir)
-        shutil.copy2(src, out)
-
-        base = MapUnlocker.compute_base(out)
-        target = base + 0x08
-        before = MapUnlocker.read_byte_at(out, target)
-        MapUnlocker.write_byte_at(out, target, 0x00)
-        after = MapUnlocker.read_byte_at(out, target)
+    def copy_and_unlock(src: Path, dest_dir: Path, out: Path = None):
+        """Copy src to dest_dir with [unlocked].map suffix and patch BASE+0x08 = 0x00.
+
+        `out` may carry a destination path pre-reserved via
+        build_unlocked_name(..., claimed=...); batch callers use this so
+        concurrent workers never resolve the same output name.
+        """
+        if out is None:
+            out = MapUnlocker.build_unlocked_name(src, dest_dir)
+        MapUnlocker._fast_copy(src, out)
+
+        # One open for everything: base computation, read-before, patch,
+        # read-after. The old helpers opened the file once per access,
+        # which is three extra open/close syscall pairs per map.
+        with open(out, "r+b") as f:
+            hdr = f.read(MapUnlocker._HDR_SIZE)
+            A = MapUnlocker._read_u16_le(f, hdr, 0x04)
+            B = MapUnlocker._read_u16_le(f, hdr, A + 0x08)
+            base = A + 0x3C + B
+            target = base + 0x08
+            f.seek(target)
+            b = f.read(1)
+            if len(b) != 1:
+                raise ValueError(f"Unexpected EOF at 0x{target:X}")
+            before = b[0]
+            f.seek(target)
+            f.write(b"\x00")
+            if VERIFY_WRITES:
+                f.seek(target)
+                after = f.read(1)[0]
+            else:
+                after = 0x00
         status = "OK" if after == 0x00 else "MISMATCH"
 
         log = []
@@ -194,46 +292,113 @@ class MapEntry:
     fullpath: Path
 
 class WorkshopScanner:
+    # Memoized scan results keyed by (root, st_mtime_ns) so repeated
+    # refreshes of an unchanged directory skip the disk walk entirely.
+    _cache: dict = {}
+    _CACHE_MAX = 16
+
     @staticmethod
-    def scan(workshop_root: Path):
+    def scan(workshop_root: Path, use_cache: bool = True):
         """
         Supports two layouts:
         1) Steam Workshop root with numbered subfolders containing .map files
         2) Any folder where .map files lie directly in the root (no subfolders)
         We scan RECURSIVELY and also include maps directly in the root.
+
+        Uses an explicit os.scandir() walk instead of pathlib globbing:
+        DirEntry objects carry the name and type info from the directory
+        listing itself, so we avoid per-entry Path construction and extra
+        stat() calls on large Workshop trees.
+
+        The root's mtime only observes its direct children, not files
+        rewritten inside existing item folders (how Steam delivers
+        workshop updates) -- so an explicit user refresh must pass
+        use_cache=False to force the walk. The fresh result still
+        replaces the cached one.
         """
-        entries = []
         if not workshop_root.exists():
-            return entries
+            return []
 
-        # Collect all *.map recursively, including the root itself.
         try:
-            maps = sorted(
-                workshop_root.rglob("*.map"),
-                key=lambda p: (p.name.lower(), str(p.parent).lower())
-            )
-        except Exception:
-            maps = []
-
-        # If rglob failed (rare), try non-recursive as fallback
-        if not maps:
-            maps = sorted(workshop_root.glob("*.map"), key=lambda p: p.name.lower())
-
-        for p in maps:
-            # Show only file name (as requested)
-            entries.append(MapEntry(display=p.name, fullpath=p))
+            key = (str(workshop_root), os.stat(workshop_root).st_mtime_ns)
+        except OSError:
+            key = None
+        if use_cache and key is not None and key in WorkshopScanner._cache:
+            return WorkshopScanner._cache[key]
+
+        # Decorate each hit with its lowercased name while we still have
+        # it in hand, so sorting needs no key function pass afterwards.
+        decorated = []
+        stack = [str(workshop_root)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            else:
+                                name_lower = entry.name.lower()
+                                if name_lower.endswith(".map"):
+                                    # Show only file name (as requested)
+                                    decorated.append((name_lower, MapEntry(display=entry.name, fullpath=Path(entry.path))))
+                        except OSError:
+                            continue
+            except OSError:
+                continue
 
+        decorated.sort(key=lambda t: t[0])
+        entries = [e for _, e in decorated]
+        if key is not None:
+            cache = WorkshopScanner._cache
+            cache[key] = entries
+            while len(cache) > WorkshopScanner._CACHE_MAX:
+                cache.pop(next(iter(cache)))  # FIFO eviction
         return entries
 
 # ----------------------------
 # i18n (dynamic discovery)
 # ----------------------------
+# language_name is by convention the first key of each lang file, so a
+# short prefix read plus a regex is enough for discovery -- the full
+# parse only happens in I18n.load when a language is actually selected.
+_LANG_NAME_RE = re.compile(rb'"language_name"\s*:\s*"([^"]+)"')
+
+@functools.lru_cache(maxsize=4)
+def _scan_languages(roots: tuple) -> tuple:
+    """Discover (code, name) pairs in the given lang roots.
+
+    Cached on the root tuple: discovery is called on startup, on every
+    menu build and on language switches, but the set of shipped language
+    files never changes within one process.
+    """
+    found = {}
+    for root_s in roots:
+        root = Path(root_s)
+        if not root.exists():
+            continue
+        for file in sorted(root.glob("*.json")):
+            code = file.stem
+            try:
+                with file.open("rb") as fh:
+                    blob = fh.read(512)
+                m = _LANG_NAME_RE.search(blob)
+                name = m.group(1).decode("utf-8") if m else code
+            except Exception:
+                name = code
+            if code not in found:
+                found[code] = name
+    return tuple(sorted(found.items(), key=lambda x: x[0]))
+
 class I18n:
     def __init__(self):
         self.cache = {}
         self.roots = language_dirs()
 
     def load(self, code: str) -> dict:
+        if code in self.cache:
+            return self.cache[code]
         for root in self.roots:
             path = root / f"{code}.json"
             if path.exists():
@@ -247,25 +412,16 @@ class I18n:
 
     def list_languages(self):
         """Return unique (code, name) from all lang roots. name is 'language_name' or the code."""
-        found = {}
-        for root in self.roots:
-            if not root.exists():
-                continue
-            for file in sorted(root.glob("*.json")):
-                code = file.stem
-                try:
-                    data = json.loads(file.read_text(encoding="utf-8"))
-                    name = data.get("language_name", code)
-                except Exception:
-                    name = code
-                if code not in found:
-                    found[code] = name
-        return [(c, n) for c, n in sorted(found.items(), key=lambda x: x[0])]
+        return list(_scan_languages(tuple(str(r) for r in self.roots)))
 
 # ----------------------------
 # GUI Application
 # ----------------------------
 class UnlockApp(tk.Tk):
+    # How many map rows to materialize in the Treeview per batch; further
+    # pages are inserted as the user scrolls toward the loaded tail.
+    _LIST_PAGE = 200
+
     def __init__(self):
         super().__init__()
         # App title is fixed (not localized)
@@ -284,6 +440,7 @@ class UnlockApp(tk.Tk):
         self.dest_var     = tk.StringVar(value=default_dest)
 
         self._entries = []  # type: list[MapEntry]
+        self._loaded_rows = 0  # rows currently materialized in the Treeview
         self._logo_img = None
         self._icon_img = None
         self._did_auto_prompt = False
@@ -299,7 +456,8 @@ class UnlockApp(tk.Tk):
         self._load_language(self.lang)
         self.lang_var = tk.StringVar(value=self.lang)  # radio state
 
-        # Build UI
+        # Build UI (localizable widgets register themselves for retranslation)
+        self._i18n_widgets = []  # type: list[tuple[object, str, dict]]
         self._build_menu()
         self._build_body()
 
@@ -321,9 +479,38 @@ class UnlockApp(tk.Tk):
         data = self.i18n.load(code) or self.i18n.load('de') or {}
         self.lang = code if data else 'de'
         self.t = data
+        self._compile_templates()
+
+    def _compile_templates(self):
+        # Pre-parse all placeholder strings once per language, so hot T()
+        # calls (per-file log lines, status updates) skip str.format's
+        # format-spec parsing. Strings with conversions or format specs
+        # stay on the str.format path.
+        self._fmt_cache = {}
+        for key, s in self.t.items():
+            if not isinstance(s, str) or "{" not in s:
+                continue
+            try:
+                parsed = list(string.Formatter().parse(s))
+            except ValueError:
+                continue
+            if any(spec or conv for _, name, spec, conv in parsed if name is not None):
+                continue
+            self._fmt_cache[key] = parsed
 
     def T(self, key: str, **kwargs) -> str:
         s = self.t.get(key, key)
+        if not kwargs:
+            return s
+        parsed = self._fmt_cache.get(key)
+        if parsed is not None:
+            try:
+                return "".join(
+                    lit + ("" if name is None else str(kwargs[name]))
+                    for lit, name, _, _ in parsed
+                )
+            except KeyError:
+                pass
         try:
             return s.format(**kwargs)
         except Exception:
@@ -334,17 +521,24 @@ class UnlockApp(tk.Tk):
             return
         self._load_language(code)
         self.lang_var.set(self.lang)
-        self._rebuild_ui()
-
-    def _rebuild_ui(self):
-        # reset title (fixed)
-        self.title(f"{APP_TITLE} – v{APP_VERSION}")
-        # clear all children and rebuild
-        for child in self.winfo_children():
-            child.destroy()
-        self._build_menu()
-        self._build_body()
-        self._refresh_list()
+        self._retranslate()
+
+    def _register_text(self, widget, key: str, **kwargs):
+        """Set a widget's localized text and remember it for retranslation."""
+        widget.configure(text=self.T(key, **kwargs))
+        self._i18n_widgets.append((widget, key, kwargs))
+
+    def _retranslate(self):
+        # A language switch is a pure text change: update the registered
+        # widgets and menu entries in place instead of destroying and
+        # rebuilding the whole widget tree (and rescanning the workshop).
+        self._retranslate_menu()
+        for widget, key, kwargs in self._i18n_widgets:
+            try:
+                widget.configure(text=self.T(key, **kwargs))
+            except tk.TclError:
+                pass
+        self.status_var.set(self.T("status_found_maps", count=len(self._entries), path=str(self.workshop_var.get())))
         self.after(0, self._ensure_statusbar_visible)
 
     # ----- Privilege helpers -----
@@ -413,6 +607,10 @@ class UnlockApp(tk.Tk):
 
     # ----- Icon / Logo -----
     def _set_window_icon(self):
+        # Prefer the shipped .ico: iconbitmap hands Tk a ready-made icon
+        # with no image decode. The PNG fallback goes straight through
+        # PhotoImage -- Tk scales window icons itself, so the old PIL
+        # decode-and-resize here was redundant.
         try:
             ico = resource_path(ICON_FILE)
             if os.name == 'nt' and ico.exists():
@@ -420,23 +618,39 @@ class UnlockApp(tk.Tk):
                 return
             logo_path = resource_path(LOGO_FILE)
             if logo_path.exists():
-                if _HAS_PIL:
-                    img = Image.open(logo_path).resize((64, 64))
-                    self._icon_img = ImageTk.PhotoImage(img)
-                else:
-                    from tkinter import PhotoImage
-                    self._icon_img = PhotoImage(file=str(logo_path))
+                from tkinter import PhotoImage
+                self._icon_img = PhotoImage(file=str(logo_path))
                 self.iconphoto(True, self._icon_img)
         except Exception:
             pass
 
     def _load_logo(self, max_width=280, max_height=100):
+        # The header logo never changes within one window; once loaded,
+        # skip even the path lookups.
+        if self._logo_img is not None:
+            return True
         try:
             logo_path = resource_path(LOGO_FILE)
+            # Prefer a pre-scaled variant shipped next to the original:
+            # it loads directly via PhotoImage with no decode-and-resize.
+            prescaled = images_path(f"CrusaderDE_Logo_{max_width}x{max_height}.png")
+            use_prescaled = prescaled.exists()
+            if use_prescaled:
+                logo_path = prescaled
             if not logo_path.exists():
                 self._logo_img = None
                 return False
-            if _HAS_PIL:
+
+            key = (str(logo_path), max_width, max_height)
+            cached = _IMG_CACHE.get(key)
+            if cached is not None:
+                self._logo_img = cached
+                return True
+
+            if use_prescaled:
+                from tkinter import PhotoImage
+                self._logo_img = PhotoImage(file=str(logo_path))
+            elif _HAS_PIL:
                 img = Image.open(logo_path)
                 w, h = img.size
                 scale = min(max_width / w, max_height / h)
@@ -449,28 +663,43 @@ class UnlockApp(tk.Tk):
                 while img.width() > max_width or img.height() > max_height:
                     img = img.subsample(2, 2)
                 self._logo_img = img
+            _IMG_CACHE[key] = self._logo_img
             return True
         except Exception:
             self._logo_img = None
             return False
 
     # ----- Menu -----
+    def _menu_add_command(self, menu, key: str, command, **kwargs):
+        """Add a localized command entry and remember it for retranslation."""
+        menu.add_command(label=self.T(key, **kwargs), command=command)
+        self._menu_entries.append((menu, menu.index("end"), key, kwargs))
+
+    def _menu_add_cascade(self, menubar, key: str, menu):
+        menubar.add_cascade(label=self.T(key), menu=menu)
+        self._menu_entries.append((menubar, menubar.index("end"), key, {}))
+
     def _build_menu(self):
+        # Menus are native OS resources on Windows, so they are built
+        # exactly once; language switches only entryconfigure the labels
+        # (see _retranslate_menu).
+        self._menu_entries = []  # type: list[tuple[tk.Menu, int, str, dict]]
         menubar = tk.Menu(self)
 
         # Datei / File
         m_file = tk.Menu(menubar, tearoff=0)
-        m_file.add_command(label=self.T("file_refresh"), command=self._refresh_list)
+        self._menu_add_command(m_file, "file_refresh", self._refresh_list)
         m_file.add_separator()
-        m_file.add_command(label=self.T("file_unlock_selected"), command=self._unlock_selected)
-        m_file.add_command(label=self.T("file_unlock_all"), command=self._unlock_all)
+        self._menu_add_command(m_file, "file_unlock_selected", self._unlock_selected)
+        self._menu_add_command(m_file, "file_unlock_all", self._unlock_all)
         m_file.add_separator()
-        m_file.add_command(label=self.T("file_runas_admin"), command=self._restart_as_admin)
+        self._menu_add_command(m_file, "file_runas_admin", self._restart_as_admin)
         m_file.add_separator()
-        m_file.add_command(label=self.T("file_exit"), command=self._on_close)
-        menubar.add_cascade(label=self.T("menu_file"), menu=m_file)
+        self._menu_add_command(m_file, "file_exit", self._on_close)
+        self._menu_add_cascade(menubar, "menu_file", m_file)
 
-        # Sprache / Language (dynamic from lang/*.json)
+        # Sprache / Language (dynamic from lang/*.json; the language names
+        # themselves are not localized, so they are not registered)
         m_lang = tk.Menu(menubar, tearoff=0)
         for code, name in self.i18n.list_languages():
             m_lang.add_radiobutton(
@@ -479,22 +708,26 @@ class UnlockApp(tk.Tk):
                 variable=self.lang_var,
                 command=lambda c=code: self._set_language(c)
             )
-        menubar.add_cascade(label=self.T("menu_language"), menu=m_lang)
+        self._menu_add_cascade(menubar, "menu_language", m_lang)
 
         # Hilfe / Help
         m_help = tk.Menu(menubar, tearoff=0)
-        m_help.add_command(label=self.T("help_readme"), command=lambda: webbrowser.open(URL_README))
-        m_help.add_command(label=self.T("help_repository"), command=lambda: webbrowser.open(URL_REPO))
-        m_help.add_command(label=self.T("help_report_issue"), command=self._open_issue_link)
+        self._menu_add_command(m_help, "help_readme", lambda: webbrowser.open(URL_README))
+        self._menu_add_command(m_help, "help_repository", lambda: webbrowser.open(URL_REPO))
+        self._menu_add_command(m_help, "help_report_issue", self._open_issue_link)
         m_help.add_separator()
-        m_help.add_command(label=self.T("help_profile", user=GH_USER), command=lambda: webbrowser.open(URL_USER))
+        self._menu_add_command(m_help, "help_profile", lambda: webbrowser.open(URL_USER), user=GH_USER)
         m_help.add_separator()
-        m_help.add_command(label=self.T("help_about"), command=self._show_about)
-        menubar.add_cascade(label=self.T("menu_help"), menu=m_help)
+        self._menu_add_command(m_help, "help_about", self._show_about)
+        self._menu_add_cascade(menubar, "menu_help", m_help)
 
         self.config(menu=menubar)
         self.bind("<F5>", lambda e: self._refresh_list())
 
+    def _retranslate_menu(self):
+        for menu, idx, key, kwargs in self._menu_entries:
+            menu.entryconfigure(idx, label=self.T(key, **kwargs))
+
     # ----- Body (single page) -----
     def _build_body(self):
         pad = 8
@@ -510,16 +743,17 @@ class UnlockApp(tk.Tk):
             self.logo_label.pack(side="left", anchor="w")
 
         # Disclaimer (localized) under the logo
-        disclaimer_frame = ttk.LabelFrame(container, text=self.T("header_disclaimer_title"))
+        disclaimer_frame = ttk.LabelFrame(container)
+        self._register_text(disclaimer_frame, "header_disclaimer_title")
         disclaimer_frame.pack(fill="x", padx=pad, pady=(8, 0))
         self.disclaimer = tk.Label(
             disclaimer_frame,
-            text=self.T("disclaimer_text"),
             justify="left",
             anchor="w",
             font=("Segoe UI", 9),
             fg="#444"
         )
+        self._register_text(self.disclaimer, "disclaimer_text")
         self.disclaimer.pack(fill="x", padx=pad, pady=(6, 8), anchor="w")
 
         def _fit_disclaimer(event):
@@ -530,47 +764,76 @@ class UnlockApp(tk.Tk):
         disclaimer_frame.bind("<Configure>", _fit_disclaimer)
 
         # Paths frame
-        frame_paths = ttk.LabelFrame(container, text=self.T("paths_title"))
+        frame_paths = ttk.LabelFrame(container)
+        self._register_text(frame_paths, "paths_title")
         frame_paths.pack(fill="x", padx=pad, pady=(pad, 0))
 
-        ttk.Label(frame_paths, text=self.T("paths_workshop")).grid(row=0, column=0, sticky="w", padx=pad, pady=4)
+        lbl_workshop = ttk.Label(frame_paths)
+        self._register_text(lbl_workshop, "paths_workshop")
+        lbl_workshop.grid(row=0, column=0, sticky="w", padx=pad, pady=4)
         e1 = ttk.Entry(frame_paths, textvariable=self.workshop_var)
         e1.grid(row=0, column=1, sticky="we", padx=(0, pad), pady=4)
-        ttk.Button(frame_paths, text=self.T("paths_browse"), command=self._browse_workshop).grid(row=0, column=2, sticky="w", padx=(0, pad), pady=4)
+        btn_browse_ws = ttk.Button(frame_paths, command=self._browse_workshop)
+        self._register_text(btn_browse_ws, "paths_browse")
+        btn_browse_ws.grid(row=0, column=2, sticky="w", padx=(0, pad), pady=4)
 
-        ttk.Label(frame_paths, text=self.T("paths_dest")).grid(row=1, column=0, sticky="w", padx=pad, pady=4)
+        lbl_dest = ttk.Label(frame_paths)
+        self._register_text(lbl_dest, "paths_dest")
+        lbl_dest.grid(row=1, column=0, sticky="w", padx=pad, pady=4)
         e2 = ttk.Entry(frame_paths, textvariable=self.dest_var)
         e2.grid(row=1, column=1, sticky="we", padx=(0, pad), pady=4)
-        ttk.Button(frame_paths, text=self.T("paths_browse"), command=self._browse_dest).grid(row=1, column=2, sticky="w", padx=(0, pad), pady=4)
+        btn_browse_dest = ttk.Button(frame_paths, command=self._browse_dest)
+        self._register_text(btn_browse_dest, "paths_browse")
+        btn_browse_dest.grid(row=1, column=2, sticky="w", padx=(0, pad), pady=4)
         frame_paths.columnconfigure(1, weight=1)
 
         # Middle split
         frame_mid = ttk.Frame(container)
         frame_mid.pack(fill="both", expand=True, padx=pad, pady=pad)
 
-        # Left: listbox
+        # Left: map list
         left = ttk.Frame(frame_mid)
         left.pack(side="left", fill="both", expand=True)
 
-        ttk.Label(left, text=self.T("list_found_title")).pack(anchor="w")
-        self.listbox = tk.Listbox(left, selectmode="extended")
-        self.listbox.pack(fill="both", expand=True, padx=(0, pad), pady=(4, 0))
+        lbl_found = ttk.Label(left)
+        self._register_text(lbl_found, "list_found_title")
+        lbl_found.pack(anchor="w")
+        list_frame = ttk.Frame(left)
+        list_frame.pack(fill="both", expand=True, padx=(0, pad), pady=(4, 0))
+        self.tree = ttk.Treeview(list_frame, show="tree", selectmode="extended")
+        self._list_vsb = ttk.Scrollbar(list_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self._on_list_scroll)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self._list_vsb.pack(side="right", fill="y")
 
         btns = ttk.Frame(left)
         btns.pack(anchor="w", pady=4)
-        ttk.Button(btns, text=self.T("select_all"), command=lambda: self.listbox.select_set(0, tk.END)).pack(side="left", padx=2)
-        ttk.Button(btns, text=self.T("clear_selection"), command=lambda: self.listbox.select_clear(0, tk.END)).pack(side="left", padx=2)
+        btn_sel_all = ttk.Button(btns, command=self._select_all_rows)
+        self._register_text(btn_sel_all, "select_all")
+        btn_sel_all.pack(side="left", padx=2)
+        btn_sel_clear = ttk.Button(btns, command=lambda: self.tree.selection_set(()))
+        self._register_text(btn_sel_clear, "clear_selection")
+        btn_sel_clear.pack(side="left", padx=2)
 
         # Right: actions + log
         right = ttk.Frame(frame_mid)
         right.pack(side="right", fill="both")
 
-        ttk.Label(right, text=self.T("actions_title")).pack(anchor="w")
-        ttk.Button(right, text=self.T("action_refresh"), command=self._refresh_list).pack(fill="x", pady=2)
-        ttk.Button(right, text=self.T("action_unlock_selected"), command=self._unlock_selected).pack(fill="x", pady=2)
-        ttk.Button(right, text=self.T("action_unlock_all"), command=self._unlock_all).pack(fill="x", pady=2)
-
-        ttk.Label(right, text=self.T("log_title")).pack(anchor="w", pady=(8, 0))
+        lbl_actions = ttk.Label(right)
+        self._register_text(lbl_actions, "actions_title")
+        lbl_actions.pack(anchor="w")
+        for key, cmd in (
+            ("action_refresh", self._refresh_list),
+            ("action_unlock_selected", self._unlock_selected),
+            ("action_unlock_all", self._unlock_all),
+        ):
+            btn = ttk.Button(right, command=cmd)
+            self._register_text(btn, key)
+            btn.pack(fill="x", pady=2)
+
+        lbl_log = ttk.Label(right)
+        self._register_text(lbl_log, "log_title")
+        lbl_log.pack(anchor="w", pady=(8, 0))
         self.log = ScrolledText(right, height=16, wrap="word")
         self.log.pack(fill="both", expand=True, pady=(4, 0))
 
@@ -609,8 +872,11 @@ class UnlockApp(tk.Tk):
         )
 
     def _refresh_list(self):
+        # This is the explicit Refresh/F5 gesture: bypass the scan cache,
+        # since workshop updates land inside existing item folders without
+        # touching the root's mtime.
         cur = Path(self.workshop_var.get())
-        entries = WorkshopScanner.scan(cur)
+        entries = WorkshopScanner.scan(cur, use_cache=False)
         if not entries:
             if str(cur).strip("\\/").lower() == WORKSHOP_CANDIDATES[0].lower():
                 alt = Path(WORKSHOP_CANDIDATES[1])
@@ -625,17 +891,43 @@ class UnlockApp(tk.Tk):
                 messagebox.showinfo(self.T("paths_title"), self.T("dialogs_workshop_pick"))
                 self._browse_workshop()
                 cur = Path(self.workshop_var.get())
-                entries = WorkshopScanner.scan(cur)
+                entries = WorkshopScanner.scan(cur, use_cache=False)
 
-        self.listbox.delete(0, tk.END)
         self._entries = entries
-        for e in entries:
-            self.listbox.insert(tk.END, e.display)
-        self.status_var.set(self.T("status_found_maps", count=len(entries), path=str(self.workshop_var.get())))
+        self._repopulate_list()
         self._log(self.T("status_scan_done", count=len(entries), path=str(self.workshop_var.get())))
 
+    def _repopulate_list(self):
+        """Reset the map list from self._entries (no disk access).
+
+        Rows are materialized lazily: only the first page goes into the
+        Treeview here, the rest is appended as the user scrolls toward
+        the end. Row iids are the indices into self._entries.
+        """
+        self.tree.delete(*self.tree.get_children())
+        self._loaded_rows = 0
+        self._load_more_rows(self._LIST_PAGE)
+        self.status_var.set(self.T("status_found_maps", count=len(self._entries), path=str(self.workshop_var.get())))
+
+    def _load_more_rows(self, n: int):
+        start = self._loaded_rows
+        end = min(start + n, len(self._entries))
+        for i in range(start, end):
+            self.tree.insert("", "end", iid=str(i), text=self._entries[i].display)
+        self._loaded_rows = end
+
+    def _on_list_scroll(self, first, last):
+        self._list_vsb.set(first, last)
+        # Nearing the loaded tail: materialize the next page.
+        if float(last) > 0.9 and self._loaded_rows < len(self._entries):
+            self._load_more_rows(self._LIST_PAGE)
+
+    def _select_all_rows(self):
+        self._load_more_rows(len(self._entries))
+        self.tree.selection_set(self.tree.get_children())
+
     def _unlock_selected(self):
-        idxs = list(self.listbox.curselection())
+        idxs = sorted(int(iid) for iid in self.tree.selection())
         if not idxs:
             messagebox.showwarning(self.T("menu_help"), self.T("dialogs_select_at_least_one"))
             return
@@ -666,18 +958,40 @@ class UnlockApp(tk.Tk):
                 return
 
         def job():
+            # Each map is an independent copy+patch, so overlap them in a
+            # thread pool to keep the storage queue full. All UI access
+            # (log + status bar) is marshalled back to the Tk main thread
+            # via after(), since Tk is not thread-safe.
             ok = 0
+            # Reserve every output name up front on this thread. Resolving
+            # names inside the workers would let two maps with the same
+            # stem (duplicate names across workshop item folders) race
+            # build_unlocked_name to the identical path and clobber each
+            # other's result.
+            claimed = set()
+            jobs = []
             for entry in items:
                 try:
-                    out, log = MapUnlocker.copy_and_unlock(entry.fullpath, dest)
-                    ok += 1
-                    self._log(log + "\n")
+                    jobs.append((entry, MapUnlocker.build_unlocked_name(entry.fullpath, dest, claimed)))
                 except PermissionError as e:
-                    self._handle_permission_error(e)
+                    self.after(0, self._handle_permission_error, e)
                 except Exception as e:
-                    self._log(self.T("logs_error_prefix", name=entry.display, error=e) + "\n")
-            self._log(self.T("status_finished", ok=ok, total=len(items)))
-            self.status_var.set(self.T("status_finished", ok=ok, total=len(items)))
+                    self.after(0, self._log, self.T("logs_error_prefix", name=entry.display, error=e) + "\n")
+            workers = min(8, (os.cpu_count() or 1) * 2)
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futures = {ex.submit(MapUnlocker.copy_and_unlock, e.fullpath, dest, out): e for e, out in jobs}
+                for fut in as_completed(futures):
+                    entry = futures[fut]
+                    try:
+                        out, log = fut.result()
+                        ok += 1
+                        self.after(0, self._log, log + "\n")
+                    except PermissionError as e:
+                        self.after(0, self._handle_permission_error, e)
+                    except Exception as e:
+                        self.after(0, self._log, self.T("logs_error_prefix", name=entry.display, error=e) + "\n")
+            self.after(0, self._log, self.T("status_finished", ok=ok, total=len(items)))
+            self.after(0, self.status_var.set, self.T("status_finished", ok=ok, total=len(items)))
         threading.Thread(target=job, daemon=True).start()
         self.status_var.set("...")
 